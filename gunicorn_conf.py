@@ -0,0 +1,16 @@
+# gunicorn_conf.py — despliegue en producción de server_stats.py
+#
+# Arranque:
+#     gunicorn -c gunicorn_conf.py server_stats:app
+#
+# El servidor de desarrollo de Werkzeug (app.run) es monohilo: una consulta
+# lenta a Mongo bloquea el proceso entero. Con workers gthread el endpoint,
+# que es casi todo espera de E/S, atiende muchas peticiones en paralelo.
+
+bind = "0.0.0.0:80"
+workers = 2
+worker_class = "gthread"
+threads = 8
+timeout = 30
+keepalive = 5
+accesslog = "-"
@@ -40,20 +40,18 @@ update_data = {
     "last_updated": datetime.utcnow(),
 }
 
-# Verificar si el email ya existe
-existing = collection.find_one({"email": email})
-
-if existing:
-    collection.update_one(
-        {"email": email},
-        {"$set": update_data}
-    )
-    print("🔁 Usuario actualizado.")
-else:
-    new_doc = {
-        "email": email,
-        "created_at": datetime.utcnow(),
-        **update_data,
-    }
-    collection.insert_one(new_doc)
+# Upsert atómico: un solo viaje a Mongo tanto para crear como para actualizar
+collection.create_index("email", unique=True)
+result = collection.update_one(
+    {"email": email},
+    {
+        "$set": update_data,
+        "$setOnInsert": {"created_at": datetime.utcnow()},
+    },
+    upsert=True,
+)
+
+if result.upserted_id is not None:
     print("✅ Usuario nuevo creado.")
+else:
+    print("🔁 Usuario actualizado.")
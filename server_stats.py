@@ -13,8 +13,12 @@ Requisitos:
     pip install flask pymongo certifi
 """
 
-from flask import Flask, request, jsonify, abort
+import time
+
+import orjson
+from flask import Flask, request, abort
 from pymongo import MongoClient
+from pymongo.errors import PyMongoError
 import certifi
 from config import (
     MONGODB_USER,
@@ -34,13 +38,44 @@ MONGO_URI = (
 )
 
 # Cliente Mongo con verificación TLS usando el bundle de certifi
+# Pool acotado y compresión de protocolo: evita el llenado en frío del pool
+# en la primera ráfaga concurrente
 client = MongoClient(
     MONGO_URI,
     tls=True,
-    tlsCAFile=certifi.where()
+    tlsCAFile=certifi.where(),
+    maxPoolSize=16,
+    minPoolSize=2,
+    serverSelectionTimeoutMS=5_000,
+    socketTimeoutMS=10_000,
+    compressors="zstd"
 )
 COL = client[MONGODB_DB_NAME]["social_accounts"]
 
+# find_one sin índice sobre email es un COLLSCAN completo por petición
+try:
+    COL.create_index("email", unique=True)
+except PyMongoError:
+    pass
+
+# Caché TTL en proceso: el scraper refresca cada ~60 s, así que servir la
+# misma respuesta durante 60 s no devuelve datos más viejos que Mongo.
+# Se guardan los bytes JSON ya serializados para no re-codificar en cada hit.
+_CACHE_TTL = 60          # segundos
+_CACHE_MAX = 10_000      # entradas
+_stats_cache = {}        # email -> (timestamp, bytes JSON)
+
+def _cache_get(email):
+    entry = _stats_cache.get(email)
+    if entry and time.monotonic() - entry[0] < _CACHE_TTL:
+        return entry[1]
+    return None
+
+def _cache_put(email, payload):
+    if len(_stats_cache) >= _CACHE_MAX:
+        _stats_cache.clear()
+    _stats_cache[email] = (time.monotonic(), payload)
+
 app = Flask(__name__)
 
 @app.route("/")
@@ -55,6 +90,12 @@ def stats():
     email = request.args.get("email")
     if not email:
         abort(400, description="Falta el parámetro 'email'")
+
+    # Servir desde caché si la entrada sigue fresca
+    cached = _cache_get(email)
+    if cached is not None:
+        return app.response_class(cached, mimetype="application/json")
+
     # Solo cuentas verificadas
     doc = COL.find_one({"email": email, "verified": True})
     if not doc:
@@ -68,8 +109,12 @@ def stats():
         "youtube":      doc.get("youtube_stats",   {}),
         "last_updated": doc.get("last_updated")
     }
-    return jsonify(resultado)
+    # orjson serializa datetime de forma nativa; default=str cubre ObjectId
+    payload = orjson.dumps(resultado, default=str, option=orjson.OPT_NAIVE_UTC)
+    _cache_put(email, payload)
+    return app.response_class(payload, mimetype="application/json")
 
 if __name__ == "__main__":
-    # En producción reemplaza el servidor dev con Gunicorn/Waitress
+    # Solo desarrollo; en producción:
+    #     gunicorn -c gunicorn_conf.py server_stats:app
     app.run(host="0.0.0.0", port=80, debug=False)
@@ -37,17 +37,17 @@ import re
 import signal
 import sys
 import time
-from datetime import datetime, timezone
-from decimal import Decimal
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Awaitable, Callable, List
 
 import certifi
 import requests
-from pymongo import MongoClient
+from requests.adapters import HTTPAdapter
+from pymongo import MongoClient, UpdateOne
 from playwright.async_api import (
-    BrowserContext,
     Page,
+    Route,
     TimeoutError,  # noqa: N811
     async_playwright,
 )
@@ -74,6 +74,8 @@ HEADLESS: bool = bool(getattr(_cfg, "HEADLESS", True))
 CONCURRENCY: int = int(getattr(_cfg, "CONCURRENCY", 4))
 RETRIES: int = int(getattr(_cfg, "RETRIES", 3))
 LOOP_EVERY: int = int(getattr(_cfg, "LOOP_EVERY", 60))  # segundos entre ciclos
+RECYCLE_EVERY: int = int(getattr(_cfg, "RECYCLE_EVERY", 50))  # ciclos entre reinicios del browser
+MAX_REFRESH: int = int(getattr(_cfg, "MAX_REFRESH", 3600))  # tope del backoff por cuenta
 
 MONGODB_URI: str = getattr(
     _cfg,
@@ -104,24 +106,66 @@ UA_STR = (
 )
 HEADERS = {"User-Agent": UA_STR, "Cache-Control": "no-cache"}
 
-_DIGIT_RE = re.compile(r"([\d.,]+)\s*([kmb]?)", re.I)
-_SUFFIX: dict[str, Decimal] = {
-    "": Decimal(1),
-    "k": Decimal(1_000),
-    "m": Decimal(1_000_000),
-    "b": Decimal(1_000_000_000),
+#  Sesión HTTP compartida: reutiliza conexiones TCP/TLS (keep-alive) entre llamadas
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+#  Patrón en bytes sobre response.content, con las dos variantes en una sola
+#  alternancia: un único barrido del HTML por llamada
+_TK_RE = re.compile(rb'data-e2e="followers-count"[^>]*>([^<]+)<|"followerCount":\s*(\d+)')
+_SUFFIX: dict[str, int] = {
+    "": 1,
+    "k": 1_000,
+    "m": 1_000_000,
+    "b": 1_000_000_000,
 }
 
 def digits(txt: str) -> int | None:
-    """Convierte «1.2M», «30 seguidores» → int."""
-    txt = txt.replace("\u202f", " ").lower()
-    m = _DIGIT_RE.search(txt)
-    if not m:
+    """Convierte «1.2M», «30 seguidores», «1,234,567» → int.
+
+    Un único barrido de la cadena, sin regex ni strings intermedios:
+    «.» separa miles, «,» es decimal (formato es) salvo que agrupe bloques
+    de tres cifras al estilo en, y sufijo k/m/b opcional. Cualquier otro
+    patrón de comas devuelve None en vez de un número truncado.
+    """
+    n = 0
+    glen = 0           # cifras del bloque actual
+    groups: list[int] = []  # longitud de cada bloque cerrado por una coma
+    seen = False
+    factor = 1
+    for c in txt:
+        if "0" <= c <= "9":
+            seen = True
+            n = n * 10 + (ord(c) - 48)
+            glen += 1
+        elif not seen:
+            continue
+        elif c == ".":  # separador de miles
+            continue
+        elif c == ",":
+            groups.append(glen)
+            glen = 0
+        elif c in (" ", "\u202f"):  # puede haber espacio antes del sufijo
+            continue
+        else:
+            low = c.lower()
+            if low in ("k", "m", "b"):
+                factor = _SUFFIX[low]
+            break
+    if not seen:
         return None
-    num_text = m.group(1).replace(".", "").replace(",", ".")
-    num = Decimal(num_text)
-    factor = _SUFFIX[m.group(2)]
-    return int(num * factor)
+    if not groups:
+        return n * factor
+    if len(groups) == 1:  # una coma: parte decimal
+        frac_div = 10 ** glen
+        return (n // frac_div) * factor + (n % frac_div) * factor // frac_div
+    # Varias comas: solo tiene sentido como agrupación de miles
+    if glen == 3 and all(g == 3 for g in groups[1:]):
+        return n * factor
+    return None
 
 
 def retry_async(times: int = 3, base: float = 1.6):
@@ -148,24 +192,48 @@ def retry_async(times: int = 3, base: float = 1.6):
 
 
 # ──────────────────────────  Mongo  ─────────────────────────
-client = MongoClient(MONGODB_URI, tlsCAFile=certifi.where())
+#  Pool presized al nivel de concurrencia + compresión de protocolo para
+#  abaratar el find() del ciclo y el bulk_write
+client = MongoClient(
+    MONGODB_URI,
+    tlsCAFile=certifi.where(),
+    maxPoolSize=max(8, CONCURRENCY * 2),
+    minPoolSize=CONCURRENCY,
+    serverSelectionTimeoutMS=5_000,
+    socketTimeoutMS=10_000,
+    compressors="zstd",
+    retryWrites=True,
+)
 COL = client[MONGODB_DB_NAME]["social_accounts"]
 
+#  El ciclo solo necesita los ids de cada red: proyectar evita arrastrar los
+#  *_stats completos en cada find()
+_CYCLE_FIELDS = {
+    "email": 1,
+    "tiktok_id": 1,
+    "instagram_id": 1,
+    "youtube_id": 1,
+    "youtube_channel_id": 1,
+}
+
 # ───────────────────────── TikTok ──────────────────────────
 @retry_async(times=RETRIES)
 async def _tk_html(user: str) -> int | None:
-    html = requests.get(f"https://www.tiktok.com/@{user}", headers=HEADERS, timeout=10).text
-    m = re.search(r'data-e2e="followers-count"[^>]*>([^<]+)<', html)
-    if m:
-        return digits(m.group(1))
-    m = re.search(r'"followerCount":\s*(\d+)', html)
-    return int(m.group(1)) if m else None
+    r = await asyncio.to_thread(SESSION.get, f"https://www.tiktok.com/@{user}", timeout=10)
+    body = r.content  # sin .text: solo se decodifica el trozo que interesa
+    m = _TK_RE.search(body)
+    if not m:
+        return None
+    if m.group(1):
+        return digits(m.group(1).decode("utf-8", "ignore"))
+    return int(m.group(2))
 
 
 @retry_async(times=RETRIES)
 async def _tk_api(user: str) -> int | None:
     url = f"https://www.tiktok.com/api/user/detail/?uniqueId={user}"
-    j = requests.get(url, headers=HEADERS, timeout=10).json()
+    r = await asyncio.to_thread(SESSION.get, url, timeout=10)
+    j = r.json()
     return j.get("userInfo", {}).get("stats", {}).get("followerCount")
 
 
@@ -184,32 +252,113 @@ YT_C = (
 )
 
 
+#  El mapeo @handle → channelId es inmutable en la práctica: cachearlo evita
+#  la Search API (100 unidades de cuota por llamada) en ciclos sucesivos
+_YT_CID_CACHE: dict[str, str] = {}
+
+
 @retry_async(times=RETRIES)
 async def yt_channel_id(handle: str) -> str | None:
-    j = requests.get(YT_S.format(h=handle), timeout=10).json()
+    if cid := _YT_CID_CACHE.get(handle):
+        return cid
+    r = await asyncio.to_thread(SESSION.get, YT_S.format(h=handle), timeout=10)
+    j = r.json()
     items = j.get("items")
-    return items[0]["snippet"]["channelId"] if items else None
+    if not items:
+        return None
+    cid = items[0]["snippet"]["channelId"]
+    _YT_CID_CACHE[handle] = cid
+    return cid
 
 
 @retry_async(times=RETRIES)
 async def yt_subscribers(cid: str) -> int | None:
-    j = requests.get(YT_C.format(cid=cid), timeout=10).json()
+    r = await asyncio.to_thread(SESSION.get, YT_C.format(cid=cid), timeout=10)
+    j = r.json()
     items = j.get("items")
     return int(items[0]["statistics"]["subscriberCount"]) if items else None
 
 
+@retry_async(times=RETRIES)
+async def _yt_stats_chunk(ids: str) -> dict[str, int] | None:
+    r = await asyncio.to_thread(SESSION.get, YT_C.format(cid=ids), timeout=10)
+    return {
+        it["id"]: int(it["statistics"]["subscriberCount"])
+        for it in r.json().get("items", [])
+    }
+
+
+async def yt_subscribers_batch(cids: list[str]) -> dict[str, int]:
+    """channels.list admite hasta 50 ids por llamada: N canales → N/50 peticiones."""
+    subs: dict[str, int] = {}
+    for i in range(0, len(cids), 50):
+        chunk = await _yt_stats_chunk(",".join(cids[i : i + 50]))
+        if chunk:
+            subs.update(chunk)
+    return subs
+
+
 # ───────────────────── Instagram (Playwright) ───────────────────
 USER_DATA = Path.cwd() / "ig_userdata"
 FOLLOWERS_LOC = "a[href$='followers/'] span[title]"
 
+#  Vía rápida sin navegador: los perfiles públicos exponen el contador en la
+#  meta description del HTML inicial; Playwright queda solo como fallback
+_IG_META_RE = re.compile(rb'content="([\d.,]+)\s*([KkMmBb]?)\s*Followers')
+
+
+async def _sync_ig_cookies(ctx: Any) -> None:
+    """Copia las cookies IG del contexto Playwright a la sesión requests.
+
+    Con la sesión logueada, la vía rápida HTTP también resuelve perfiles que
+    Instagram solo sirve completos a usuarios identificados.
+    """
+    for c in await ctx.cookies("https://www.instagram.com"):
+        SESSION.cookies.set(
+            c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/")
+        )
+
+
+@retry_async(times=RETRIES)
+async def _ig_html(user: str) -> int | None:
+    r = await asyncio.to_thread(SESSION.get, f"https://www.instagram.com/{user}/", timeout=10)
+    m = _IG_META_RE.search(r.content)
+    if not m:
+        return None
+    num = m.group(1).decode("ascii", "ignore").replace(",", "")
+    suffix = m.group(2).decode("ascii", "ignore").lower()
+    return int(float(num) * _SUFFIX[suffix])
+
+
+#  Para leer un número no hace falta descargar imágenes, vídeo ni fuentes,
+#  y menos aún los trackers de analítica
+_BLOCKED_RESOURCES = {"image", "media", "font", "stylesheet"}
+_BLOCKED_HOSTS = ("googletagmanager.com", "google-analytics.com", "facebook.com/tr")
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    req = route.request
+    if req.resource_type in _BLOCKED_RESOURCES or any(h in req.url for h in _BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 async def _accept_cookies(page: Page) -> None:
+    # El banner solo aparece una vez por página: no sondearlo en cada visita
+    if getattr(page, "_cookies_done", False):
+        return
     with contextlib.suppress(TimeoutError):
         await page.locator("text=/^(Aceptar todas|Accept all)/i").click(timeout=5_000)
         logger.debug("🍪 Cookies aceptadas")
+    page._cookies_done = True
 
 
 async def _login_if_needed(page: Page) -> None:
+    # La sesión vive en ig_userdata: tras un login correcto basta con vigilar
+    # que IG no nos haya devuelto a /accounts/login
+    if getattr(page, "_logged_in", False) and "/accounts/login" not in page.url:
+        return
     if await page.is_visible("input[name='username']"):
         logger.info("🔑 Rellenando credenciales IG…")
         await page.fill("input[name='username']", IG_USER)
@@ -218,6 +367,7 @@ async def _login_if_needed(page: Page) -> None:
         with contextlib.suppress(TimeoutError):
             await page.wait_for_selector("text=/Guardar información|Save info/i", timeout=15_000)
             await page.click("text=/Ahora no|Not now/i", timeout=5_000)
+    page._logged_in = True
 
 
 def _ig_retry(fn: Callable[..., Awaitable[Any]]):
@@ -240,7 +390,12 @@ def _ig_retry(fn: Callable[..., Awaitable[Any]]):
 
 @_ig_retry
 async def _ensure_profile(page: Page, user: str) -> None:
-    await page.goto(f"https://www.instagram.com/{user}/", timeout=0)
+    # No esperar al evento load completo: con el DOM basta, el selector de
+    # seguidores marca el momento real en que se puede leer
+    with contextlib.suppress(TimeoutError):
+        await page.goto(
+            f"https://www.instagram.com/{user}/", wait_until="domcontentloaded", timeout=15_000
+        )
     await _accept_cookies(page)
     await _login_if_needed(page)
     await page.wait_for_selector(FOLLOWERS_LOC, timeout=15_000)
@@ -249,67 +404,138 @@ async def _ensure_profile(page: Page, user: str) -> None:
 @_ig_retry
 async def instagram_followers(page: Page, user: str) -> int | None:
     await _ensure_profile(page, user)
-    txt = await page.locator(FOLLOWERS_LOC).inner_text()
-    return digits(txt)
+    # Una sola evaluación JS en vez de locator + inner_text: el atributo
+    # title trae además la cifra exacta, no la abreviada
+    raw = await page.eval_on_selector(
+        FOLLOWERS_LOC, "el => el.getAttribute('title') || el.textContent"
+    )
+    if not raw:
+        return None
+    # El contexto va en en-US: el title llega agrupado con comas («235,941»),
+    # que para digits() serían decimales; se eliminan antes de parsear
+    return digits(raw.replace(",", ""))
 
 
 # ─────────────────────────── Main Loop ───────────────────────────
-async def gather_followers(ctx: BrowserContext, doc: dict) -> None:
-    """Procesa una sola cuenta de Mongo y actualiza sus stats."""
+async def _do_tk(doc: dict, now: datetime) -> tuple[dict[str, Any], str]:
+    tk = doc["tiktok_id"]
+    tk_followers = await tiktok_followers(tk)
+    #  Claves con punto: $set solo toca las hojas y respeta otros campos
+    #  que puedan vivir bajo *_stats
+    upd = {
+        "tiktok_stats.followers": tk_followers,
+        "tiktok_stats.updated_at": now,
+    }
+    return upd, f"TikTok:@{tk} → {tk_followers}"
+
+
+async def _do_ig(page_pool: asyncio.Queue, doc: dict, now: datetime) -> tuple[dict[str, Any], str]:
+    ig = doc["instagram_id"]
+    ig_followers = await _ig_html(ig)
+    if ig_followers is None:
+        page = await page_pool.get()
+        try:
+            ig_followers = await instagram_followers(page, ig)
+            # La navegación puede haber renovado cookies: refrescar la sesión
+            await _sync_ig_cookies(page.context)
+        finally:
+            # about:blank suelta el DOM del perfil antes de devolver la página
+            with contextlib.suppress(Exception):
+                await page.goto("about:blank")
+            page_pool.put_nowait(page)
+    upd = {
+        "instagram_stats.followers": ig_followers,
+        "instagram_stats.updated_at": now,
+    }
+    return upd, f"Instagram:@{ig} → {ig_followers}"
+
+
+async def _do_yt(
+    doc: dict, subs_by_cid: dict[str, int], now: datetime
+) -> tuple[dict[str, Any], str]:
+    yh = doc["youtube_id"]
+    cid = doc.get("youtube_channel_id") or await yt_channel_id(yh)
+    subs = None
+    if cid:
+        # Resuelto normalmente por la llamada batch del ciclo; la petición
+        # individual queda para canales recién descubiertos
+        subs = subs_by_cid.get(cid)
+        if subs is None:
+            subs = await yt_subscribers(cid)
+    upd: dict[str, Any] = {}
+    if subs is not None:
+        upd["youtube_channel_id"] = cid
+        upd["youtube_stats.subscribers"] = subs
+        upd["youtube_stats.updated_at"] = now
+    return upd, f"YouTube:@{yh} → {subs}"
+
+
+async def gather_followers(
+    page_pool: asyncio.Queue, doc: dict, subs_by_cid: dict[str, int]
+) -> tuple[Any, dict[str, Any]]:
+    """Procesa una sola cuenta de Mongo y devuelve `(_id, upd)` para el bulk_write."""
     start = time.perf_counter()
     upd: dict[str, Any] = {}
     log_parts: List[str] = []
 
     email = doc.get("email", "sin_email")
-
-    # TikTok
-    if tk := doc.get("tiktok_id"):
-        tk_followers = await tiktok_followers(tk)
-        upd["tiktok_stats"] = {
-            "followers": tk_followers,
-            "updated_at": datetime.now(timezone.utc),
-        }
-        log_parts.append(f"TikTok:@{tk} → {tk_followers}")
-
-    # Instagram (necesita página)
-    if ig := doc.get("instagram_id"):
-        page = await ctx.new_page()
-        ig_followers = await instagram_followers(page, ig)
-        await page.close()
-        upd["instagram_stats"] = {
-            "followers": ig_followers,
-            "updated_at": datetime.now(timezone.utc),
-        }
-        log_parts.append(f"Instagram:@{ig} → {ig_followers}")
-
-    # YouTube
-    if yh := doc.get("youtube_id"):
-        cid = doc.get("youtube_channel_id") or await yt_channel_id(yh)
-        subs = await yt_subscribers(cid) if cid else None
-        if subs is not None:
-            upd["youtube_channel_id"] = cid
-            upd["youtube_stats"] = {
-                "subscribers": subs,
-                "updated_at": datetime.now(timezone.utc),
-            }
-        log_parts.append(f"YouTube:@{yh} → {subs}")
-
-    upd["last_updated"] = datetime.now(timezone.utc)
-    COL.update_one({"_id": doc["_id"]}, {"$set": upd})
+    #  Un único timestamp por cuenta: todas las stats del doc quedan fechadas
+    #  en el mismo instante del ciclo
+    now = datetime.now(timezone.utc)
+
+    # Las tres plataformas son independientes: solapamos sus latencias de red
+    subtasks = []
+    if doc.get("tiktok_id"):
+        subtasks.append(_do_tk(doc, now))
+    if doc.get("instagram_id"):
+        subtasks.append(_do_ig(page_pool, doc, now))
+    if doc.get("youtube_id"):
+        subtasks.append(_do_yt(doc, subs_by_cid, now))
+
+    for res in await asyncio.gather(*subtasks, return_exceptions=True):
+        if isinstance(res, BaseException):
+            logger.error("❌ %s: subtarea fallida – %s", email, res)
+            continue
+        partial, log_line = res
+        upd.update(partial)
+        log_parts.append(log_line)
+
+    upd["last_updated"] = now
 
     elapsed = time.perf_counter() - start
     logger.info("✅ %s actualizado en %.2fs | %s", email, elapsed, " | ".join(log_parts))
+    return doc["_id"], upd
 
 
 async def main() -> None:
-    async with async_playwright() as pw:
-        ig_ctx = await pw.chromium.launch_persistent_context(
-            USER_DATA,
-            headless=HEADLESS,
-            locale="en-US",
-            user_agent=UA_STR,
-            args=["--lang=en-US,en"],
-        )
+    #  Un único driver Playwright para toda la vida del proceso; .start()
+    #  explícito para que los reciclados de contexto no lo reinicien
+    pw = await async_playwright().start()
+    try:
+
+        async def _launch_ig() -> tuple[Any, asyncio.Queue]:
+            """Contexto IG + pool de páginas precreadas (evita new_page() por cuenta)."""
+            ctx = await pw.chromium.launch_persistent_context(
+                USER_DATA,
+                headless=HEADLESS,
+                locale="en-US",
+                user_agent=UA_STR,
+                args=[
+                    "--lang=en-US,en",
+                    "--disable-dev-shm-usage",  # /dev/shm pequeño en Docker
+                    "--disable-gpu",
+                    "--no-sandbox",  # obligatorio junto a --no-zygote en Linux
+                    "--no-zygote",
+                ],
+            )
+            await ctx.route("**/*", _block_heavy_resources)
+            pool: asyncio.Queue = asyncio.Queue()
+            for _ in range(CONCURRENCY):
+                pool.put_nowait(await ctx.new_page())
+            await _sync_ig_cookies(ctx)
+            return ctx, pool
+
+        ig_ctx, page_pool = await _launch_ig()
 
         # Registro de señales (solo en plataformas que lo soporten)
         try:
@@ -319,25 +545,143 @@ async def main() -> None:
         except NotImplementedError:
             pass
 
+        # Índice parcial para que la consulta del ciclo sea un IXSCAN
+        COL.create_index([("verified", 1)], partialFilterExpression={"verified": True})
+        COL.create_index([("last_updated", 1)])
+
         sem = asyncio.Semaphore(CONCURRENCY)
+        cycles = 0
+
+        #  Último valor visto por cuenta: si ningún contador cambió desde el
+        #  ciclo anterior, la escritura se ahorra (máx. 1 h sin refrescar)
+        last_counts: dict[Any, tuple[tuple, datetime]] = {}
+
+        #  Planificación adaptativa: cuentas estables duplican su intervalo de
+        #  refresco (hasta MAX_REFRESH); un cambio lo devuelve a LOOP_EVERY
+        refresh: dict[Any, tuple[datetime, float]] = {}  # _id -> (próximo, intervalo)
+
+        #  Última vez que cada cuenta apareció en el find() del ciclo, para
+        #  purgar el estado de las que se borran o pierden verified
+        last_seen: dict[Any, datetime] = {}
 
         while True:
             cycle_start = time.perf_counter()
             tasks = []
 
-            async def worker(document: dict) -> None:
+            # Mongo filtra en servidor las cuentas refrescadas hace un momento
+            # (p. ej. tras un alta manual a mitad de ciclo)
+            cutoff = datetime.now(timezone.utc) - timedelta(seconds=LOOP_EVERY * 0.9)
+            query = {
+                "verified": True,
+                "$or": [
+                    {"last_updated": {"$lt": cutoff}},
+                    {"last_updated": {"$exists": False}},
+                ],
+            }
+            #  pymongo es síncrono: fuera del loop para no congelar Playwright/HTTP
+            docs = await asyncio.to_thread(
+                lambda: list(COL.find(query, _CYCLE_FIELDS).batch_size(200))
+            )
+
+            now_cycle = datetime.now(timezone.utc)
+
+            # Purgar el estado de cuentas que llevan más de dos ciclos sin
+            # aparecer (borradas o verified=False); la ausencia corta tras una
+            # escritura —el filtro del cutoff— no llega a ese margen. Sin esto,
+            # sus entradas vencidas en `refresh` dejarían el sleep adaptativo
+            # clavado en 1 s para siempre.
+            fetched = {d["_id"] for d in docs}
+            for _id in fetched:
+                last_seen[_id] = now_cycle
+            for _id, ts in list(last_seen.items()):
+                if _id not in fetched and (now_cycle - ts).total_seconds() > LOOP_EVERY * 2:
+                    del last_seen[_id]
+                    refresh.pop(_id, None)
+                    last_counts.pop(_id, None)
+
+            # Quedarse solo con las cuentas cuyo turno ha llegado
+            docs = [d for d in docs if refresh.get(d["_id"], (now_cycle, 0))[0] <= now_cycle]
+
+            # Precargar la caché handle→channelId con los ids ya persistidos
+            for d in docs:
+                if d.get("youtube_id") and d.get("youtube_channel_id"):
+                    _YT_CID_CACHE.setdefault(d["youtube_id"], d["youtube_channel_id"])
+
+            # Resolver los handles aún sin channelId para que entren en el batch
+            pending = [
+                d for d in docs if d.get("youtube_id") and not d.get("youtube_channel_id")
+            ]
+            for d, cid in zip(
+                pending,
+                await asyncio.gather(*(yt_channel_id(d["youtube_id"]) for d in pending)),
+            ):
+                if cid:
+                    d["youtube_channel_id"] = cid
+
+            # Una llamada a channels.list por cada 50 canales resueltos
+            cids = [d["youtube_channel_id"] for d in docs if d.get("youtube_channel_id")]
+            subs_by_cid = await yt_subscribers_batch(cids) if cids else {}
+
+            async def worker(document: dict) -> tuple[Any, dict[str, Any]]:
                 async with sem:
-                    await gather_followers(ig_ctx, document)
+                    return await gather_followers(page_pool, document, subs_by_cid)
 
-            for document in COL.find({"verified": True}):
+            for document in docs:
                 tasks.append(asyncio.create_task(worker(document)))
 
-            await asyncio.gather(*tasks)
+            results = await asyncio.gather(*tasks)
+
+            # Una sola ida y vuelta a Mongo por ciclo en vez de una por cuenta,
+            # y solo para cuentas cuyos contadores realmente cambiaron
+            ops = []
+            for _id, upd in results:
+                if not upd:
+                    continue
+                counts = (
+                    upd.get("tiktok_stats.followers"),
+                    upd.get("instagram_stats.followers"),
+                    upd.get("youtube_stats.subscribers"),
+                )
+                prev = last_counts.get(_id)
+                changed = prev is None or prev[0] != counts
+                interval = (
+                    LOOP_EVERY
+                    if changed
+                    else min(refresh.get(_id, (now_cycle, LOOP_EVERY))[1] * 2, MAX_REFRESH)
+                )
+                refresh[_id] = (upd["last_updated"] + timedelta(seconds=interval), interval)
+                if not changed and upd["last_updated"] - prev[1] < timedelta(hours=1):
+                    continue
+                last_counts[_id] = (counts, upd["last_updated"])
+                ops.append(UpdateOne({"_id": _id}, {"$set": upd}))
+
+            if ops:
+                await asyncio.to_thread(COL.bulk_write, ops, ordered=False)
+
+            # Chromium acumula memoria en bucles largos de goto: reciclar el
+            # contexto acota el RSS (la sesión IG persiste en ig_userdata)
+            cycles += 1
+            if cycles % RECYCLE_EVERY == 0:
+                logger.info("♻️ Reciclando contexto IG tras %s ciclos", cycles)
+                await ig_ctx.close()
+                ig_ctx, page_pool = await _launch_ig()
+
             cycle_elapsed = time.perf_counter() - cycle_start
+
+            # Dormir hasta el siguiente vencimiento, acotado a [1, LOOP_EVERY]
+            # para que las altas nuevas no esperen a las cuentas en backoff
+            if refresh:
+                next_due = min(ts for ts, _ in refresh.values())
+                wait = (next_due - datetime.now(timezone.utc)).total_seconds()
+            else:
+                wait = LOOP_EVERY - cycle_elapsed
+            wait = max(1.0, min(wait, LOOP_EVERY))
             logger.info(
-                "🔄 Ciclo completo en %.2fs – próxima pasada en %ss", cycle_elapsed, LOOP_EVERY
+                "🔄 Ciclo completo en %.2fs – próxima pasada en %ss", cycle_elapsed, int(wait)
             )
-            await asyncio.sleep(max(0, LOOP_EVERY - cycle_elapsed))
+            await asyncio.sleep(wait)
+    finally:
+        await pw.stop()
 
 
 if __name__ == "__main__":